@@ -0,0 +1,269 @@
+"""Review aggregation logic behind aggregate-reviews.py
+
+Kept in an importable module so CPython caches its bytecode between runs.
+"""
+
+import json
+import mmap
+import sys
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Parsed JSON objects; the review format is loose, so values stay Any
+Issue = Dict[str, Any]
+Review = Dict[str, Any]
+
+# orjson parses UTF-8 bytes directly and is much faster; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+json_loads: Callable[[Any], Any] = orjson.loads if orjson else json.loads
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    # Match orjson's compact output so both backends emit the same bytes
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+# Reviews at least this large are memory-mapped rather than read when orjson,
+# which can parse straight from the mapping, is available
+MMAP_THRESHOLD = 256 * 1024
+
+# Severities in report order, and the marker printed for each; issues with an
+# unrecognised severity are reported last under "other"
+_SEVERITY_ORDER = ("critical", "high", "medium", "low")
+_REPORT_ORDER = _SEVERITY_ORDER + ("other",)
+_EMOJI = {"critical": "🚨", "high": "❗", "medium": "⚠️ ", "low": "💡", "other": "❔"}
+
+@lru_cache(maxsize=1)
+def find_config_file() -> Optional[Path]:
+    """Find the config.json file by walking up the directory tree (cached)"""
+    for directory in Path(__file__).resolve().parents:
+        config_path = directory / "config.json"
+        if config_path.exists():
+            return config_path
+    return None
+
+def load_config() -> Dict[str, Any]:
+    """Load configuration from config.json"""
+    config_path = find_config_file()
+    if config_path:
+        try:
+            with open(config_path, 'rb') as f:
+                return json_loads(f.read())
+        except Exception as e:
+            print(f"Warning: Failed to load config.json: {e}", file=sys.stderr)
+    return {}
+
+def loads_buffer(content: Union[bytes, mmap.mmap]) -> Any:
+    """Parse JSON from bytes, or from a memory-mapped file without copying it"""
+    if isinstance(content, mmap.mmap):
+        with memoryview(content) as view:
+            return json_loads(view)
+    return json_loads(content)
+
+def parse_review(content: Union[bytes, mmap.mmap]) -> Any:
+    """Parse review file content, return None if no JSON could be recovered"""
+    # First try to parse as JSON
+    try:
+        data = loads_buffer(content)
+        # Check if this is Claude's wrapper format
+        if isinstance(data, dict) and 'result' in data and isinstance(data['result'], str):
+            # Extract the actual review JSON from Claude's result field
+            result = data['result']
+            # Slice out the object, dropping markdown code fences and
+            # any prose around it without rewriting the string
+            start = result.find('{')
+            end = result.rfind('}')
+            if 0 <= start < end:
+                result = result[start:end + 1]
+            return json_loads(result)
+        else:
+            return data
+    except json.JSONDecodeError:
+        # Try to extract JSON from the content (claude might add extra text)
+        start = content.find(b'{')
+        end = content.rfind(b'}')
+        if 0 <= start < end:
+            return json_loads(content[start:end + 1])
+    return None
+
+def validate_review(data: Any, filepath: str) -> Review:
+    """Check a review is an object with a list of issue objects, return the error result if not"""
+    if not isinstance(data, dict) or not isinstance(data.get("issues", []), list):
+        if data is not None:
+            print(f"Warning: Unexpected review format in {filepath}", file=sys.stderr)
+        return {"status": "error", "issues": []}
+    
+    # Only the structure is checked; field values inside an issue are left as-is,
+    # since the report prints any value and classify_issues buckets a
+    # non-string severity under "other"
+    issues = data.get("issues", [])
+    valid = [issue for issue in issues if isinstance(issue, dict)]
+    if len(valid) != len(issues):
+        print(f"Warning: Skipped {len(issues) - len(valid)} malformed issues in {filepath}", file=sys.stderr)
+    data["issues"] = valid
+    return data
+
+def load_review(filepath: str) -> Review:
+    """Load a review JSON file, return empty dict if failed"""
+    try:
+        # Reviewers that produced no output leave an empty file; skip the read.
+        # Pipes and other non-regular files report size 0, so always read those
+        st = os.stat(filepath)
+        is_regular = stat.S_ISREG(st.st_mode)
+        if is_regular and st.st_size == 0:
+            return {"status": "error", "issues": []}
+        
+        with open(filepath, 'rb') as f:
+            if orjson and is_regular and st.st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return validate_review(parse_review(mm), filepath)
+            
+            # Whitespace-only content fails to parse and falls through to the
+            # error result, so the bytes are not stripped (and copied)
+            content = f.read()
+        return validate_review(parse_review(content), filepath)
+    except Exception as e:
+        print(f"Warning: Failed to load {filepath}: {e}", file=sys.stderr)
+        return {"status": "error", "issues": []}
+
+def classify_issues(reviews: Dict[str, Review]) -> Tuple[Dict[str, List[Issue]], bool, bool, int]:
+    """Group issues by severity, return (by_severity, has_critical, has_high, total)"""
+    by_severity: Dict[str, List[Issue]] = defaultdict(list)
+    has_failed_review = False
+    
+    for role, review in reviews.items():
+        if review.get("status") == "fail":
+            has_failed_review = True
+        
+        # The loop only tags and buckets; the flags are read off the buckets
+        for issue in review.get("issues", []):
+            issue["reviewer"] = role
+            severity = issue.get("severity", "medium")
+            # LLM output can give null, a list or an object here, which can't
+            # be normalised (or even used as a key), so report those as "other"
+            if not isinstance(severity, str):
+                severity = "other"
+            by_severity[severity].append(issue)
+    
+    # Normalise other spellings once per distinct severity rather than per issue
+    for severity in [key for key in by_severity if key not in _SEVERITY_ORDER]:
+        issues = by_severity.pop(severity)
+        normalized = severity.lower()
+        by_severity[normalized if normalized in _SEVERITY_ORDER else "other"].extend(issues)
+    
+    has_critical = has_failed_review or "critical" in by_severity
+    has_high = "high" in by_severity
+    total = sum(len(issues) for issues in by_severity.values())
+    return by_severity, has_critical, has_high, total
+
+def format_issue(issue: Issue) -> str:
+    """Format one issue as the indented lines shown in the report"""
+    # Bind the lookup once; this runs for every issue in the report
+    get = issue.get
+    text = f"  [{issue['reviewer']}] {get('file', '?')}:{get('line', '?')}\n    {get('issue', '')}"
+    suggestion = get('suggestion')
+    if suggestion:
+        text += f"\n    → {suggestion}"
+    return text
+
+def aggregate_reviews(architect_path: str, security_path: str, testing_path: str, documentation_path: Optional[str] = None, devops_path: Optional[str] = None, ux_path: Optional[str] = None, json_output: bool = False) -> int:
+    """Aggregate all review results and determine overall status"""
+    
+    paths = [
+        ("architect", architect_path),
+        ("security", security_path),
+        ("testing", testing_path)
+    ]
+    
+    # Add optional review roles if provided
+    if documentation_path and os.path.exists(documentation_path):
+        paths.append(("documentation", documentation_path))
+    if devops_path and os.path.exists(devops_path):
+        paths.append(("devops", devops_path))
+    if ux_path and os.path.exists(ux_path):
+        paths.append(("ux", ux_path))
+    
+    # Review files are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        results = executor.map(load_review, [path for _, path in paths])
+        reviews = dict(zip([role for role, _ in paths], results))
+    
+    by_severity, has_critical, has_high, total = classify_issues(reviews)
+    
+    # Return non-zero if critical or high issues were found
+    result = 1 if total and (has_critical or has_high) else 0
+    
+    # Machine-readable report for CI, written as bytes straight to the fd
+    if json_output:
+        # Like the text report, a run with no issues never blocks, so the flags
+        # are only set when there are issues; severities follow report order
+        report = {
+            "total": total,
+            "by_severity": {severity: by_severity[severity] for severity in _REPORT_ORDER if severity in by_severity},
+            "has_critical": bool(total) and has_critical,
+            "has_high": bool(total) and has_high,
+            "blocking": bool(result)
+        }
+        sys.stdout.buffer.write(json_dumps(report) + b"\n")
+        sys.stdout.buffer.flush()
+        return result
+    
+    # Print results
+    if not total:
+        sys.stdout.write("✅ No issues found in AI reviews\n")
+        return 0
+    
+    # Build the report in memory and emit it with a single write
+    out = [f"\n📊 AI Review Summary: {total} issues found\n\n"]
+    
+    # Print issues by severity
+    for severity in _REPORT_ORDER:
+        issues = by_severity.get(severity, ())
+        if issues:
+            header = f"{_EMOJI[severity]} {severity.upper()} ({len(issues)} issues):"
+            body = "\n".join([format_issue(issue) for issue in issues])
+            out.append(f"{header}\n{body}\n\n")
+    
+    if has_critical:
+        out.append("❌ Critical issues must be fixed before committing\n")
+    elif has_high:
+        out.append("⚠️  High priority issues should be addressed\n")
+        out.append("Use 'git commit --no-verify' to bypass if necessary\n")
+    else:
+        out.append("✅ No blocking issues found\n")
+    
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+    return result
+
+def main(argv: List[str]) -> int:
+    """Run the aggregation from command-line arguments, return the exit code"""
+    # --json may appear anywhere; the remaining arguments are the review files
+    args = [arg for arg in argv[1:] if arg != "--json"]
+    json_output = len(args) != len(argv) - 1
+    
+    if len(args) < 3:
+        print("Usage: aggregate-reviews.py [--json] <architect.json> <security.json> <testing.json> [documentation.json] [devops.json] [ux.json]", file=sys.stderr)
+        return 1
+    
+    # Required parameters
+    architect_path = args[0]
+    security_path = args[1]
+    testing_path = args[2]
+    
+    # Optional parameters
+    documentation_path = args[3] if len(args) > 3 else None
+    devops_path = args[4] if len(args) > 4 else None
+    ux_path = args[5] if len(args) > 5 else None
+    
+    return aggregate_reviews(architect_path, security_path, testing_path, 
+                             documentation_path, devops_path, ux_path, json_output)